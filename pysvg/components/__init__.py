@@ -1,5 +1,5 @@
-from .rectangle import Rectangle, RectangleConfig
-from .circle import Circle, CircleConfig
+from .rectangle import Rectangle, RectangleBatch, RectangleConfig
+from .circle import Circle, CircleBatch, CircleConfig
 from .line import Line, LineConfig
 from .ellipse import Ellipse, EllipseConfig
 from .polyline import Polyline, PolylineConfig
@@ -11,8 +11,10 @@ from .matrix import Matrix, MatrixConfig, MatElemType
 __all__ = [
     "Rectangle",
     "RectangleConfig",
+    "RectangleBatch",
     "Circle",
     "CircleConfig",
+    "CircleBatch",
     "Line",
     "LineConfig",
     "Ellipse",
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Literal, Tuple
+from typing import Any, Literal, Tuple
 
 from pysvg.logger import get_logger
 from pysvg.schema import AppearanceConfig, BBox, ComponentConfig, TransformConfig
@@ -29,10 +29,20 @@ class BaseSVGComponent(ABC):
             appearance: External appearance configuration
             transform: Transform configuration
         """
+        # Last rendered SVG element and the config versions it was rendered from
+        self._svg_cache: str | None = None
+        self._svg_cache_key: tuple[int, ...] | None = None
+
         self.config = config
         self.appearance = appearance
         self.transform = transform
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Replacing a config or any other public attribute (text, href, ...) invalidates the cache
+        if not name.startswith("_"):
+            self._svg_cache = None
+
     @property
     @abstractmethod
     def central_point_relative(self) -> Tuple[float, float]:
@@ -78,6 +88,31 @@ class BaseSVGComponent(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    @staticmethod
+    def _compute_fit_scale(
+        current_width: float, current_height: float, width: float, height: float
+    ) -> float:
+        """
+        Get the largest scale factor at which a box of the current size fits into the target size.
+
+        A dimension of size zero doesn't limit the scale factor. A box with no extent at all
+        can't be scaled, so it gets a scale factor of 1.
+
+        Args:
+            current_width: Current width of the component
+            current_height: Current height of the component
+            width: Target width
+            height: Target height
+
+        Returns:
+            The scale factor, may be greater than 1
+        """
+        if current_width <= 0 and current_height <= 0:
+            return 1.0
+        width_scale = width / current_width if current_width > 0 else float("inf")
+        height_scale = height / current_height if current_height > 0 else float("inf")
+        return min(width_scale, height_scale)
+
     @abstractmethod
     def to_svg_element(self) -> str:
         """
@@ -102,8 +137,9 @@ class BaseSVGComponent(ABC):
         relative_x, relative_y = self.central_point_relative
 
         if not self.has_transform():
+            # Let loguru format the message lazily, this is called a lot during layout
             _logger.debug(
-                f"{self.__class__.__name__} has no transform, returning relative central point"
+                "{} has no transform, returning relative central point", self.__class__.__name__
             )
             return relative_x, relative_y
 
@@ -114,20 +150,48 @@ class BaseSVGComponent(ABC):
         """
         Get the attributes of the component as a dictionary.
         """
-        attr = {}
-        if self.has_config():
-            attr.update(self.config.to_svg_dict())
-        if self.has_appearance():
-            attr.update(self.appearance.to_svg_dict())
-        if self.has_transform():
-            attr.update(self.transform.to_svg_dict())
-        attr = {k: str(v) for k, v in attr.items()}
-        return attr
+        # to_svg_dict already returns string values, so the dicts are combined in one step
+        # without a re-stringifying pass
+        return {
+            **(self.config.to_svg_dict() if self.has_config() else {}),
+            **(self.appearance.to_svg_dict() if self.has_appearance() else {}),
+            **(self.transform.to_svg_dict() if self.has_transform() else {}),
+        }
 
     def get_attr_str(self) -> str:
         """Get the attributes of the component as a string."""
-        attr = self.get_attr_dict()
-        return " ".join([f'{k}="{v}"' for k, v in attr.items() if v is not None])
+        # Concatenate the (memoized) attribute strings of each config instead of merging dicts
+        attr = self.config.to_svg_attr_str() if self.has_config() else ""
+        tail = self._tail_attr_str()
+        return attr + tail if attr else tail[1:]
+
+    def _tail_attr_str(self) -> str:
+        """Get the appearance and transform attributes as a string, each prefixed with a space."""
+        tail = ""
+        if self.has_appearance() and (attr := self.appearance.to_svg_attr_str()):
+            tail += " " + attr
+        if self.has_transform() and (attr := self.transform.to_svg_attr_str()):
+            tail += " " + attr
+        return tail
+
+    def _svg_cache_state(self) -> tuple[int, ...]:
+        """Get the versions of the configs that the rendered SVG element depends on."""
+        return tuple(
+            cfg.version if cfg is not None else -1
+            for cfg in (self.config, self.appearance, self.transform)
+        )
+
+    def _load_svg_cache(self) -> str | None:
+        """Get the cached SVG element, or None if any config changed since it was rendered."""
+        if self._svg_cache is not None and self._svg_cache_key == self._svg_cache_state():
+            return self._svg_cache
+        return None
+
+    def _store_svg_cache(self, svg: str) -> str:
+        """Cache the rendered SVG element and return it."""
+        self._svg_cache = svg
+        self._svg_cache_key = self._svg_cache_state()
+        return svg
 
     def has_config(self) -> bool:
         """Check if the component has a config."""
@@ -0,0 +1,126 @@
+from abc import abstractmethod
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Literal, Tuple
+from typing_extensions import override
+
+from pysvg.schema import AppearanceConfig, TransformConfig, BBox
+from pysvg.components.base import BaseSVGComponent
+from pysvg.utils import format_number
+
+
+class ColumnBatch(BaseSVGComponent):
+    """
+    Base class for batches of SVG shapes sharing one appearance and transform.
+
+    The geometry is stored column-wise in one `array("d")` buffer per attribute instead of one
+    component (with its own pydantic configs) per shape, so building, measuring and rendering
+    thousands of shapes stays cheap. It renders to one element per shape.
+
+    Subclasses name their columns, give the element template, and define the edges of each
+    shape and how the columns scale.
+    """
+
+    # Names of the geometry columns, in the order of the element template placeholders
+    _columns: Tuple[str, ...] = ()
+    # Template of one element: a placeholder per column, then one for the shared attributes
+    _element_template: str = ""
+    # Name of a single shape, used in error messages
+    _shape_name: str = ""
+
+    def __init__(
+        self,
+        columns: Sequence[Sequence[float]],
+        appearance: AppearanceConfig | None = None,
+        transform: TransformConfig | None = None,
+    ):
+        lengths = [len(values) for values in columns]
+        if len(set(lengths)) > 1:
+            names = ", ".join(self._columns[:-1]) + " and " + self._columns[-1]
+            got = ", ".join(map(str, lengths[:-1])) + f" and {lengths[-1]}"
+            raise ValueError(f"{names} must have the same length, got {got}")
+        if lengths[0] == 0:
+            raise ValueError(f"{type(self).__name__} must have at least one {self._shape_name}")
+
+        super().__init__(
+            appearance=appearance or AppearanceConfig(),
+            transform=transform or TransformConfig(),
+        )
+        for name, values in zip(self._columns, columns):
+            setattr(self, name, array("d", values))
+
+    def __len__(self) -> int:
+        return len(getattr(self, self._columns[0]))
+
+    @abstractmethod
+    def _get_edges(
+        self,
+    ) -> Tuple[Iterable[float], Iterable[float], Iterable[float], Iterable[float]]:
+        """Get the (left, top, right, bottom) edges of every shape in relative coordinates."""
+        raise NotImplementedError("Not implemented")
+
+    @abstractmethod
+    def _scale_columns(self, center_x: float, center_y: float, scale_factor: float) -> None:
+        """Scale the shapes by `scale_factor` relative to the center of the batch."""
+        raise NotImplementedError("Not implemented")
+
+    @staticmethod
+    def _scale_about(values: array, center: float, scale_factor: float) -> array:
+        """Scale positions relative to `center`."""
+        return array("d", [center + (v - center) * scale_factor for v in values])
+
+    @staticmethod
+    def _scale_in_place(values: array, scale_factor: float) -> array:
+        """Scale sizes, e.g. radii or widths."""
+        return array("d", [v * scale_factor for v in values])
+
+    def _get_extent(self) -> Tuple[float, float, float, float]:
+        """Get (min_x, min_y, max_x, max_y) of all shapes in relative coordinates."""
+        lefts, tops, rights, bottoms = self._get_edges()
+        return (min(lefts), min(tops), max(rights), max(bottoms))
+
+    @override
+    @property
+    def central_point_relative(self) -> Tuple[float, float]:
+        min_x, min_y, max_x, max_y = self._get_extent()
+        return ((min_x + max_x) / 2, (min_y + max_y) / 2)
+
+    @override
+    def get_bounding_box(self) -> BBox:
+        min_x, min_y, max_x, max_y = self._get_extent()
+        return BBox(
+            x=self.transform.translate[0] + min_x,
+            y=self.transform.translate[1] + min_y,
+            width=max_x - min_x,
+            height=max_y - min_y,
+        )
+
+    @override
+    def restrict_size(
+        self, width: float, height: float, mode: Literal["fit", "force"] = "fit"
+    ) -> "ColumnBatch":
+        min_x, min_y, max_x, max_y = self._get_extent()
+        current_width = max_x - min_x
+        current_height = max_y - min_y
+
+        # Use the smaller scale factor to ensure the batch fits within both limits
+        scale_factor = self._compute_fit_scale(current_width, current_height, width, height)
+
+        if mode == "fit" and scale_factor >= 1.0:
+            return self
+
+        self._scale_columns((min_x + max_x) / 2, (min_y + max_y) / 2, scale_factor)
+        return self
+
+    @override
+    def to_svg_element(self) -> str:
+        """
+        Generate the SVG elements of the batch, one per line
+
+        Returns:
+            XML string of SVG elements
+        """
+        tail = self._tail_attr_str()
+        template = self._element_template
+        columns = [getattr(self, name) for name in self._columns]
+        return "\n".join([template % (*map(format_number, row), tail) for row in zip(*columns)])
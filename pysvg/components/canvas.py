@@ -1,9 +1,9 @@
-from typing import List, Literal, Tuple
+from typing import Iterator, List, Literal, Tuple
 from pathlib import Path
 from pysvg.constants import INDENT
 from pysvg.schema import ComponentConfig
 from pysvg.components.base import BaseSVGComponent, BBox
-from pysvg.utils import resolve_path, mkdir
+from pysvg.utils import format_number, resolve_path, mkdir
 from pydantic import Field
 from typing_extensions import override
 
@@ -22,13 +22,13 @@ class CanvasConfig(ComponentConfig):
     def to_svg_dict(self) -> dict[str, str]:
         """Convert config parameters to SVG attributes dictionary."""
         attrs = {
-            "width": str(self.width),
-            "height": str(self.height),
+            "width": format_number(self.width),
+            "height": format_number(self.height),
         }
         if self.viewbox is not None:
-            attrs["viewBox"] = " ".join(str(x) for x in self.viewbox)
+            attrs["viewBox"] = " ".join(format_number(x) for x in self.viewbox)
         else:
-            attrs["viewBox"] = f"0 0 {self.width} {self.height}"
+            attrs["viewBox"] = f"0 0 {attrs['width']} {attrs['height']}"
 
         attrs.update(
             {"xmlns": "http://www.w3.org/2000/svg", "xmlns:xlink": "http://www.w3.org/1999/xlink"}
@@ -70,11 +70,41 @@ class Canvas(BaseSVGComponent):
             height=self.config.height,
         )
 
+    def get_components_bounding_box(self) -> BBox | None:
+        """
+        Get the union bounding box of all components on the canvas.
+
+        Components whose size can't be determined (e.g. text) are skipped.
+
+        Returns:
+            The bounding box enclosing all components, or None if no component has one
+        """
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
+        for component in self.components:
+            try:
+                x, y, width, height = component.get_bounding_box().as_tuple()
+            except (NotImplementedError, RuntimeWarning):
+                continue
+            # Single pass over the children, keeping the running extent in locals
+            if x < min_x:
+                min_x = x
+            if y < min_y:
+                min_y = y
+            if x + width > max_x:
+                max_x = x + width
+            if y + height > max_y:
+                max_y = y + height
+
+        if min_x == float("inf"):
+            return None
+        return BBox(x=min_x, y=min_y, width=max_x - min_x, height=max_y - min_y)
+
     @override
     def restrict_size(
         self, width: float, height: float, mode: Literal["fit", "force"] = "fit"
     ) -> "Canvas":
-        ratio = min(width / self.config.width, height / self.config.height)
+        ratio = self._compute_fit_scale(self.config.width, self.config.height, width, height)
         if mode == "fit" and ratio >= 1.0:
             return self
         self.config.width = self.config.width * ratio
@@ -89,15 +119,27 @@ class Canvas(BaseSVGComponent):
         Returns:
             Complete SVG element as XML string
         """
+        return "".join(self._iter_svg_chunks())
+
+    def _iter_svg_chunks(self) -> Iterator[str]:
+        """
+        Generate the SVG document piece by piece, so that it can be streamed to a file
+        without materializing the whole document first.
+        """
         # Start with XML declaration and SVG opening tag with namespace and viewBox
-        attrs = self.get_attr_str()
+        newline = "\n" + INDENT
+        yield f"<svg {self.get_attr_str()}>{newline}"
 
-        components_code = "\n".join([component.to_svg_element() for component in self.components])
+        # Indent each child on its own instead of re-scanning the whole document afterwards;
+        # only multi-line children (e.g. cells) need their inner lines indented
+        for i, component in enumerate(self.components):
+            if i:
+                yield newline
+            elem = component.to_svg_element()
+            yield elem.replace("\n", newline) if "\n" in elem else elem
 
         # Close SVG tag
-        svg = f"<svg {attrs}>\n{components_code}".replace("\n", "\n" + INDENT) + "\n</svg>"
-
-        return svg
+        yield "\n</svg>"
 
     def add(self, component: BaseSVGComponent) -> "Canvas":
         """
@@ -132,6 +174,7 @@ class Canvas(BaseSVGComponent):
         # Create parent directories if they don't exist
         mkdir(path.parent)
 
-        # Write SVG content to file
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.to_svg_element())
+        # Write SVG content to file, encoding each chunk directly instead of going through
+        # a text-mode wrapper
+        with open(path, "wb") as f:
+            f.writelines(chunk.encode("utf-8") for chunk in self._iter_svg_chunks())
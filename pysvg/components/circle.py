@@ -1,10 +1,20 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from math import pi as _PI
+from operator import add, sub
 from typing import Literal, Tuple
 from typing_extensions import override
 
 from pysvg.schema import AppearanceConfig, TransformConfig, BBox
 from pysvg.components.base import BaseSVGComponent, ComponentConfig
+from pysvg.components.batch import ColumnBatch
+from pysvg.utils import format_number
 from pydantic import Field
 
+_TAU = 2.0 * _PI
+
+_CIRCLE_TEMPLATE = '<circle cx="%s" cy="%s" r="%s"%s />'
+
 
 class CircleConfig(ComponentConfig):
     """Geometry configuration for Circle components."""
@@ -15,9 +25,11 @@ class CircleConfig(ComponentConfig):
 
     @override
     def to_svg_dict(self) -> dict[str, str]:
-        attrs = self.model_dump(exclude_none=True)
-        attrs = {k: str(v) for k, v in attrs.items()}
-        return attrs
+        return {
+            "cx": format_number(self.cx),
+            "cy": format_number(self.cy),
+            "r": format_number(self.r),
+        }
 
 
 class Circle(BaseSVGComponent):
@@ -58,17 +70,13 @@ class Circle(BaseSVGComponent):
         # For a circle, both width and height equal the diameter (2 * r)
         current_diameter = 2 * self.config.r
 
-        # Use the smaller dimension to ensure the circle fits within both limits
-        target_diameter = min(width, height)
-
-        if mode == "fit":
-            # Only scale down if the current diameter is larger than target
-            if current_diameter > target_diameter:
-                self.config.r = target_diameter / 2
-        elif mode == "force":
-            # Scale to exactly match the target diameter, regardless of current size
-            self.config.r = target_diameter / 2
+        # Only scale down in "fit" mode; "force" scales to exactly match the target diameter
+        scale_factor = self._compute_fit_scale(current_diameter, current_diameter, width, height)
+        if mode == "fit" and scale_factor >= 1.0:
+            return self
 
+        # Use the smaller dimension to ensure the circle fits within both limits
+        self.config.r = min(width, height) / 2
         return self
 
     @override
@@ -79,9 +87,39 @@ class Circle(BaseSVGComponent):
         Returns:
             XML string of SVG circle element
         """
-        attrs = self.get_attr_dict()
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<circle {' '.join(attrs_ls)} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        svg = _CIRCLE_TEMPLATE % (
+            format_number(self.config.cx),
+            format_number(self.config.cy),
+            format_number(self.config.r),
+            self._tail_attr_str(),
+        )
+        return self._store_svg_cache(svg)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        cx: Sequence[float],
+        cy: Sequence[float],
+        r: Sequence[float],
+        appearance: AppearanceConfig | None = None,
+        transform: TransformConfig | None = None,
+    ) -> "CircleBatch":
+        """
+        Create many circles sharing one appearance and transform at once.
+
+        Args:
+            cx: Center X coordinates
+            cy: Center Y coordinates
+            r: Radii (must be non-negative)
+            appearance: Appearance shared by all circles
+            transform: Transform shared by all circles
+
+        Returns:
+            A CircleBatch holding all circles
+        """
+        return CircleBatch(cx, cy, r, appearance=appearance, transform=transform)
 
     def get_area(self) -> float:
         """
@@ -90,9 +128,8 @@ class Circle(BaseSVGComponent):
         Returns:
             Circle area
         """
-        import math
-
-        return math.pi * self.config.r**2
+        r = self.config.r
+        return _PI * r * r
 
     def get_circumference(self) -> float:
         """
@@ -101,6 +138,51 @@ class Circle(BaseSVGComponent):
         Returns:
             Circle circumference
         """
-        import math
+        return _TAU * self.config.r
+
+
+class CircleBatch(ColumnBatch):
+    """
+    A batch of SVG circles sharing one appearance and transform.
+
+    Circles are stored in the `cx`, `cy` and `r` columns and render to one `<circle>` element
+    per circle.
+    """
+
+    _columns = ("cx", "cy", "r")
+    _element_template = _CIRCLE_TEMPLATE
+    _shape_name = "circle"
+
+    cx: array
+    cy: array
+    r: array
+
+    def __init__(
+        self,
+        cx: Sequence[float],
+        cy: Sequence[float],
+        r: Sequence[float],
+        appearance: AppearanceConfig | None = None,
+        transform: TransformConfig | None = None,
+    ):
+        super().__init__((cx, cy, r), appearance=appearance, transform=transform)
+        if min(self.r) < 0:
+            raise ValueError("Circle radius must be non-negative")
+
+    @override
+    def _get_edges(
+        self,
+    ) -> Tuple[Iterable[float], Iterable[float], Iterable[float], Iterable[float]]:
+        return (
+            map(sub, self.cx, self.r),
+            map(sub, self.cy, self.r),
+            map(add, self.cx, self.r),
+            map(add, self.cy, self.r),
+        )
 
-        return 2 * math.pi * self.config.r
+    @override
+    def _scale_columns(self, center_x: float, center_y: float, scale_factor: float) -> None:
+        # Scale centers relative to the center of the batch, and radii in place
+        self.cx = self._scale_about(self.cx, center_x, scale_factor)
+        self.cy = self._scale_about(self.cy, center_y, scale_factor)
+        self.r = self._scale_in_place(self.r, scale_factor)
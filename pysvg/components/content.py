@@ -1,15 +1,29 @@
+import re
+import sys
 from typing import Literal, Tuple
-from pydantic import Field
+from pydantic import Field, field_validator
 from typing_extensions import override
 
 from pysvg.schema import TransformConfig, Color, BBox, ComponentConfig
 from pysvg.components.base import BaseSVGComponent
+from pysvg.utils import format_number
 from pysvg.logger import get_logger
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
 _logger = get_logger()
 
+_TEXT_TEMPLATE = "<text %s%s>%s</text>"
+_IMAGE_TEMPLATE = '<image %s%s href="%s" />'
+_USE_TEMPLATE = '<use %s%s href="#%s" />'
+
+_NON_NUMERIC_RE = re.compile(r"[^0-9.]")
+_XMLNS_PREFIXED_RE = re.compile(r'\s+xmlns:[^=]*="[^"]*"')
+_XMLNS_DEFAULT_RE = re.compile(r'\s+xmlns="[^"]*"')
+_NS_OPEN_TAG_RE = re.compile(r"<ns\d+:")
+_NS_CLOSE_TAG_RE = re.compile(r"</ns\d+:")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class TextConfig(ComponentConfig):
     """Geometry configuration for Text components"""
@@ -30,19 +44,23 @@ class TextConfig(ComponentConfig):
         default="central", description="Vertical text alignment"
     )
 
+    @field_validator("font_family")
+    def intern_font_family(cls, v: str) -> str:
+        # Font families repeat across many texts, so share one string object between them
+        return sys.intern(v)
+
     @override
     def to_svg_dict(self) -> dict[str, str]:
-        attrs = self.model_dump(exclude_none=True)
-        attrs = {k: str(v) for k, v in attrs.items()}
-        attrs = {
-            k.replace("_", "-")
-            if k in ["text_anchor", "dominant_baseline", "font_size", "font_family"]
-            else k: v
-            for k, v in attrs.items()
+        # Fields are fixed, so build the dict directly instead of dumping and renaming keys
+        return {
+            "x": format_number(self.x),
+            "y": format_number(self.y),
+            "font-size": format_number(self.font_size),
+            "font-family": self.font_family,
+            "text-anchor": self.text_anchor,
+            "dominant-baseline": self.dominant_baseline,
+            "fill": self.color.value,
         }
-        if "color" in attrs:
-            attrs["fill"] = attrs.pop("color")
-        return attrs
 
 
 class ImageConfig(ComponentConfig):
@@ -56,11 +74,19 @@ class ImageConfig(ComponentConfig):
         default="xMidYMid meet", description="How to preserve aspect ratio"
     )
 
+    @field_validator("preserveAspectRatio")
+    def intern_preserve_aspect_ratio(cls, v: str) -> str:
+        return sys.intern(v)
+
     @override
     def to_svg_dict(self) -> dict[str, str]:
-        attrs = self.model_dump(exclude_none=True)
-        attrs = {k: str(v) for k, v in attrs.items()}
-        return attrs
+        return {
+            "x": format_number(self.x),
+            "y": format_number(self.y),
+            "width": format_number(self.width),
+            "height": format_number(self.height),
+            "preserveAspectRatio": self.preserveAspectRatio,
+        }
 
 
 class TextContent(BaseSVGComponent):
@@ -107,9 +133,10 @@ class TextContent(BaseSVGComponent):
 
     @override
     def to_svg_element(self) -> str:
-        attrs = self.get_attr_dict()
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<text {' '.join(attrs_ls)}>{self.text}</text>"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        svg = _TEXT_TEMPLATE % (self.config.to_svg_attr_str(), self._tail_attr_str(), self.text)
+        return self._store_svg_cache(svg)
 
 
 class ImageContent(BaseSVGComponent):
@@ -141,7 +168,7 @@ class ImageContent(BaseSVGComponent):
     def restrict_size(
         self, width: float, height: float, mode: Literal["fit", "force"] = "fit"
     ) -> "ImageContent":
-        ratio = min(width / self.config.width, height / self.config.height)
+        ratio = self._compute_fit_scale(self.config.width, self.config.height, width, height)
         if mode == "fit" and ratio >= 1.0:
             return self
         self.config.width = self.config.width * ratio
@@ -150,10 +177,10 @@ class ImageContent(BaseSVGComponent):
 
     @override
     def to_svg_element(self) -> str:
-        attrs = self.get_attr_dict()
-        attrs["href"] = self.href
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<image {' '.join(attrs_ls)} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        svg = _IMAGE_TEMPLATE % (self.config.to_svg_attr_str(), self._tail_attr_str(), self.href)
+        return self._store_svg_cache(svg)
 
 
 class SVGContent(BaseSVGComponent):
@@ -203,10 +230,8 @@ class SVGContent(BaseSVGComponent):
                 width = root.get("width", "100")
                 height = root.get("height", "100")
                 # Remove units like 'px', 'pt', etc.
-                import re
-
-                width = re.sub(r"[^0-9.]", "", str(width))
-                height = re.sub(r"[^0-9.]", "", str(height))
+                width = _NON_NUMERIC_RE.sub("", str(width))
+                height = _NON_NUMERIC_RE.sub("", str(height))
                 viewbox = f"0 0 {width} {height}"
 
             self._viewbox = viewbox
@@ -222,8 +247,6 @@ class SVGContent(BaseSVGComponent):
             self._svg_content = "\n".join(inner_content)
         except ET.ParseError:
             # Fallback: use regex to extract content between <svg> tags
-            import re
-
             svg_match = re.search(r"<svg([^>]*)>(.*?)</svg>", svg_content, re.DOTALL)
             if svg_match:
                 svg_attrs = svg_match.group(1)
@@ -240,8 +263,8 @@ class SVGContent(BaseSVGComponent):
                     width = width_match.group(1) if width_match else "100"
                     height = height_match.group(1) if height_match else "100"
                     # Remove units
-                    width = re.sub(r"[^0-9.]", "", str(width))
-                    height = re.sub(r"[^0-9.]", "", str(height))
+                    width = _NON_NUMERIC_RE.sub("", str(width))
+                    height = _NON_NUMERIC_RE.sub("", str(height))
                     self._viewbox = f"0 0 {width} {height}"
 
                 self._svg_content = self._clean_namespaces(content)
@@ -252,20 +275,18 @@ class SVGContent(BaseSVGComponent):
 
     def _clean_namespaces(self, svg_string: str) -> str:
         """Clean namespace prefixes and declarations from SVG string"""
-        import re
-
         # Remove xmlns declarations
-        svg_string = re.sub(r'\s+xmlns:[^=]*="[^"]*"', "", svg_string)
-        svg_string = re.sub(r'\s+xmlns="[^"]*"', "", svg_string)
+        svg_string = _XMLNS_PREFIXED_RE.sub("", svg_string)
+        svg_string = _XMLNS_DEFAULT_RE.sub("", svg_string)
 
         # Remove namespace prefixes (like ns0:, ns1:, etc.)
         # Handle opening tags: <ns0: -> <
-        svg_string = re.sub(r"<ns\d+:", "<", svg_string)
+        svg_string = _NS_OPEN_TAG_RE.sub("<", svg_string)
         # Handle closing tags: </ns0: -> </
-        svg_string = re.sub(r"</ns\d+:", "</", svg_string)
+        svg_string = _NS_CLOSE_TAG_RE.sub("</", svg_string)
 
         # Clean up any extra whitespace
-        svg_string = re.sub(r"\s+", " ", svg_string)
+        svg_string = _WHITESPACE_RE.sub(" ", svg_string)
         svg_string = svg_string.strip()
 
         return svg_string
@@ -296,7 +317,7 @@ class SVGContent(BaseSVGComponent):
     def restrict_size(
         self, width: float, height: float, mode: Literal["fit", "force"] = "fit"
     ) -> "SVGContent":
-        ratio = min(width / self.config.width, height / self.config.height)
+        ratio = self._compute_fit_scale(self.config.width, self.config.height, width, height)
         if mode == "fit" and ratio >= 1.0:
             return self
         self.config.width = self.config.width * ratio
@@ -306,7 +327,7 @@ class SVGContent(BaseSVGComponent):
     @override
     def to_svg_element(self) -> str:
         """Generate use element that references the symbol"""
-        attrs = self.get_attr_dict()
-        attrs["href"] = f"#{self.symbol_id}"
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<use {' '.join(attrs_ls)} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        svg = _USE_TEMPLATE % (self.config.to_svg_attr_str(), self._tail_attr_str(), self.symbol_id)
+        return self._store_svg_cache(svg)
@@ -1,10 +1,14 @@
+import math
 from typing import Literal, Tuple
 from typing_extensions import override
 
 from pysvg.schema import AppearanceConfig, TransformConfig, BBox
 from pysvg.components.base import BaseSVGComponent, ComponentConfig
+from pysvg.utils import format_number
 from pydantic import Field
 
+_ELLIPSE_TEMPLATE = '<ellipse cx="%s" cy="%s" rx="%s" ry="%s"%s />'
+
 
 class EllipseConfig(ComponentConfig):
     """Geometry configuration for Ellipse components."""
@@ -17,9 +21,12 @@ class EllipseConfig(ComponentConfig):
     @override
     def to_svg_dict(self) -> dict[str, str]:
         """Convert config parameters to SVG attributes dictionary."""
-        attrs = self.model_dump(exclude_none=True)
-        attrs = {k: str(v) for k, v in attrs.items()}
-        return attrs
+        return {
+            "cx": format_number(self.cx),
+            "cy": format_number(self.cy),
+            "rx": format_number(self.rx),
+            "ry": format_number(self.ry),
+        }
 
 
 class Ellipse(BaseSVGComponent):
@@ -61,12 +68,8 @@ class Ellipse(BaseSVGComponent):
         current_width = 2 * self.config.rx
         current_height = 2 * self.config.ry
 
-        # Calculate scale factors for width and height
-        width_scale = width / current_width
-        height_scale = height / current_height
-
         # Use the smaller scale factor to ensure the ellipse fits within both limits
-        scale_factor = min(width_scale, height_scale)
+        scale_factor = self._compute_fit_scale(current_width, current_height, width, height)
 
         if mode == "fit" and scale_factor >= 1.0:
             return self
@@ -78,9 +81,16 @@ class Ellipse(BaseSVGComponent):
 
     @override
     def to_svg_element(self) -> str:
-        attrs = self.get_attr_dict()
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<ellipse {' '.join(attrs_ls)} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        svg = _ELLIPSE_TEMPLATE % (
+            format_number(self.config.cx),
+            format_number(self.config.cy),
+            format_number(self.config.rx),
+            format_number(self.config.ry),
+            self._tail_attr_str(),
+        )
+        return self._store_svg_cache(svg)
 
     def get_area(self) -> float:
         """
@@ -89,8 +99,6 @@ class Ellipse(BaseSVGComponent):
         Returns:
             Ellipse area
         """
-        import math
-
         return math.pi * self.config.rx * self.config.ry
 
     def get_circumference(self) -> float:
@@ -100,8 +108,6 @@ class Ellipse(BaseSVGComponent):
         Returns:
             Ellipse circumference (approximate)
         """
-        import math
-
         a = self.config.rx
         b = self.config.ry
         # Ramanujan's approximation for ellipse circumference
@@ -126,8 +132,6 @@ class Ellipse(BaseSVGComponent):
         Returns:
             Ellipse eccentricity (0 for circle, approaching 1 for very elongated ellipse)
         """
-        import math
-
         a = max(self.config.rx, self.config.ry)  # Semi-major axis
         b = min(self.config.rx, self.config.ry)  # Semi-minor axis
         if a == 0:
@@ -1,10 +1,14 @@
+import math
 from typing import Literal, Tuple
 from typing_extensions import override
 
 from pysvg.schema import AppearanceConfig, TransformConfig, BBox
 from pysvg.components.base import BaseSVGComponent, ComponentConfig
+from pysvg.utils import format_number
 from pydantic import Field
 
+_LINE_TEMPLATE = '<line x1="%s" y1="%s" x2="%s" y2="%s"%s />'
+
 
 class LineConfig(ComponentConfig):
     """Geometry configuration for Line components."""
@@ -17,9 +21,12 @@ class LineConfig(ComponentConfig):
     @override
     def to_svg_dict(self) -> dict[str, str]:
         """Convert config parameters to SVG attributes dictionary."""
-        attrs = self.model_dump(exclude_none=True)
-        attrs = {k: str(v) for k, v in attrs.items()}
-        return attrs
+        return {
+            "x1": format_number(self.x1),
+            "y1": format_number(self.y1),
+            "x2": format_number(self.x2),
+            "y2": format_number(self.y2),
+        }
 
 
 class Line(BaseSVGComponent):
@@ -67,12 +74,8 @@ class Line(BaseSVGComponent):
         if current_width == 0 and current_height == 0:
             return self
 
-        # Calculate scale factors for width and height
-        width_scale = width / current_width if current_width > 0 else float("inf")
-        height_scale = height / current_height if current_height > 0 else float("inf")
-
         # Use the smaller scale factor to ensure the line fits within both limits
-        scale_factor = min(width_scale, height_scale)
+        scale_factor = self._compute_fit_scale(current_width, current_height, width, height)
 
         if mode == "fit" and scale_factor >= 1.0:
             return self
@@ -102,7 +105,16 @@ class Line(BaseSVGComponent):
 
     @override
     def to_svg_element(self) -> str:
-        return f"<line {self.get_attr_str()} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        svg = _LINE_TEMPLATE % (
+            format_number(self.config.x1),
+            format_number(self.config.y1),
+            format_number(self.config.x2),
+            format_number(self.config.y2),
+            self._tail_attr_str(),
+        )
+        return self._store_svg_cache(svg)
 
     def get_length(self) -> float:
         """
@@ -111,8 +123,6 @@ class Line(BaseSVGComponent):
         Returns:
             Line length
         """
-        import math
-
         dx = self.config.x2 - self.config.x1
         dy = self.config.y2 - self.config.y1
         return math.sqrt(dx**2 + dy**2)
@@ -137,8 +147,6 @@ class Line(BaseSVGComponent):
         Returns:
             Line angle in degrees (0-360)
         """
-        import math
-
         dx = self.config.x2 - self.config.x1
         dy = self.config.y2 - self.config.y1
         angle_rad = math.atan2(dy, dx)
@@ -1,42 +1,103 @@
-from typing import List, Tuple, Literal
+from itertools import chain, islice
+from math import dist
+from operator import itemgetter
+from typing import Any, List, Tuple, Literal
 from typing_extensions import override
 
 from pysvg.schema import AppearanceConfig, TransformConfig, BBox
+from pysvg.schema.svg_config import next_svg_version
 from pysvg.components.base import BaseSVGComponent, ComponentConfig
+from pysvg.utils import format_number
 from pydantic import Field, field_validator
 
 
+class PointList(list):
+    """
+    List of polyline points that tracks in-place modifications.
+
+    Every modification draws a new version, which the owning PolylineConfig reports as its own,
+    so appending to `config.points` directly invalidates the render and geometry caches too.
+    """
+
+    def __init__(self, points=()):
+        super().__init__(points)
+        self.version = next_svg_version()
+
+
+def _track_modification(name: str):
+    method = getattr(list, name)
+
+    def tracked(self, *args):
+        result = method(self, *args)
+        self.version = next_svg_version()
+        return result
+
+    tracked.__name__ = name
+    return tracked
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(PointList, _name, _track_modification(_name))
+
+
 class PolylineConfig(ComponentConfig):
     """Geometry configuration for Polyline components."""
 
     points: List[Tuple[float, float]] = Field(
-        default_factory=list, description="List of (x, y) coordinate tuples defining the polyline"
+        default_factory=PointList,
+        description="List of (x, y) coordinate tuples defining the polyline",
     )
 
     @field_validator("points")
     def validate_points(cls, v):
+        # The List[Tuple[float, float]] annotation already makes pydantic check the shape and
+        # coerce the coordinates of every point, so only the emptiness check is left here
         if not v:
             raise ValueError("Polyline must have at least one point")
-        for i, point in enumerate(v):
-            if not isinstance(point, (tuple, list)) or len(point) != 2:
-                raise ValueError(f"Point {i} must be a tuple/list of two numbers, got {point}")
-            if not all(isinstance(coord, (int, float)) for coord in point):
-                raise ValueError(f"Point {i} coordinates must be numbers, got {point}")
-        return v
+        return PointList(v)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assignment isn't validated, so wrap assigned points here to keep tracking them
+        if name == "points" and not isinstance(value, PointList):
+            value = PointList(map(tuple, value))
+        super().__setattr__(name, value)
+
+    @override
+    @property
+    def version(self) -> int:
+        # Versions only ever grow, so the newer of the config and its points is the current one
+        return max(super().version, getattr(self.points, "version", 0))
 
     @override
     def to_svg_dict(self) -> dict[str, str]:
         """Convert config parameters to SVG attributes dictionary."""
         attrs = {}
         if self.points:
-            points_str = " ".join(f"{x},{y}" for x, y in self.points)
-            attrs["points"] = points_str
+            # Format the flattened coordinates in one C-level map, then pair them back up as "x,y"
+            coords = map(format_number, chain.from_iterable(self.points))
+            attrs["points"] = " ".join(map(",".join, zip(coords, coords)))
         return attrs
 
 
 class Polyline(BaseSVGComponent):
     """
     SVG Polyline Component
+
+    The points are kept in a PointList, so they can be changed through `add_point`,
+    `add_points`, `clear_points`, by modifying `config.points` in place or by assigning it.
     """
 
     def __init__(
@@ -45,6 +106,9 @@ class Polyline(BaseSVGComponent):
         appearance: AppearanceConfig | None = None,
         transform: TransformConfig | None = None,
     ):
+        self._points_cache: dict[str, Any] = {}
+        self._points_cache_config: PolylineConfig | None = None
+        self._points_cache_version = -1
         super().__init__(
             config=config or PolylineConfig(),
             appearance=appearance or AppearanceConfig(),
@@ -54,46 +118,54 @@ class Polyline(BaseSVGComponent):
     @override
     @property
     def central_point_relative(self) -> Tuple[float, float]:
-        if not self.config.points:
+        points = self.config.points
+        if not points:
             return (0, 0)
-
-        total_x = sum(x for x, y in self.config.points)
-        total_y = sum(y for x, y in self.config.points)
-        count = len(self.config.points)
-
-        return (total_x / count, total_y / count)
+        if len(points) == 1:
+            x, y = points[0]
+            return (x, y)
+
+        cache = self._load_points_cache()
+        if (center := cache.get("center")) is None:
+            # map over C-level callables instead of generator expressions to keep the loops out
+            # of the interpreter
+            total_x = sum(map(itemgetter(0), points))
+            total_y = sum(map(itemgetter(1), points))
+            count = len(points)
+            center = cache["center"] = (total_x / count, total_y / count)
+        return center
 
     @override
     def get_bounding_box(self) -> BBox:
         if not self.config.points:
             return BBox(x=0, y=0, width=0, height=0)
 
-        x_coords = [x for x, y in self.config.points]
-        y_coords = [y for x, y in self.config.points]
-
+        min_x, min_y, max_x, max_y = self._point_extents()
         return BBox(
-            x=self.transform.translate[0] + min(x_coords),
-            y=self.transform.translate[1] + min(y_coords),
-            width=max(x_coords) - min(x_coords),
-            height=max(y_coords) - min(y_coords),
+            x=self.transform.translate[0] + min_x,
+            y=self.transform.translate[1] + min_y,
+            width=max_x - min_x,
+            height=max_y - min_y,
         )
 
     @override
     def restrict_size(
         self, width: float, height: float, mode: Literal["fit", "force"] = "fit"
     ) -> "Polyline":
-        if not self.config.points:
+        # Zero or one point has no size to restrict
+        if len(self.config.points) < 2:
             return self
 
-        current_width = self.get_bounding_box().width
-        current_height = self.get_bounding_box().height
+        min_x, min_y, max_x, max_y = self._point_extents()
+        current_width = max_x - min_x
+        current_height = max_y - min_y
 
-        # Calculate scale factors for width and height
-        width_scale = width / current_width if current_width > 0 else float("inf")
-        height_scale = height / current_height if current_height > 0 else float("inf")
+        # Handle edge case where all points coincide (no width or height)
+        if current_width == 0 and current_height == 0:
+            return self
 
         # Use the smaller scale factor to ensure the polyline fits within both limits
-        scale_factor = min(width_scale, height_scale)
+        scale_factor = self._compute_fit_scale(current_width, current_height, width, height)
 
         if mode == "fit" and scale_factor >= 1.0:
             return self
@@ -123,9 +195,47 @@ class Polyline(BaseSVGComponent):
 
     @override
     def to_svg_element(self) -> str:
-        attrs = self.get_attr_dict()
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<polyline {' '.join(attrs_ls)} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        return self._store_svg_cache(f"<polyline {self.get_attr_str()} />")
+
+    def _point_extents(self) -> tuple[float, float, float, float]:
+        """Get (min_x, min_y, max_x, max_y) of the points, computed once per config version."""
+        cache = self._load_points_cache()
+        if (extents := cache.get("extents")) is not None:
+            return extents
+
+        points = self.config.points
+        min_x = max_x = points[0][0]
+        min_y = max_y = points[0][1]
+        for x, y in points:
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        extents = cache["extents"] = (min_x, min_y, max_x, max_y)
+        return extents
+
+    def _load_points_cache(self) -> dict[str, Any]:
+        """Get the store for aggregates derived from the points, reset whenever the config changes."""
+        config = self.config
+        if self._points_cache_config is not config or self._points_cache_version != config.version:
+            self._points_cache = {}
+            self._points_cache_config = config
+            self._points_cache_version = config.version
+        return self._points_cache
+
+    def _segment_lengths(self) -> tuple[float, ...]:
+        """Get the length of each segment, computed once per config version."""
+        cache = self._load_points_cache()
+        if (lengths := cache.get("segment_lengths")) is None:
+            points = self.config.points
+            lengths = cache["segment_lengths"] = tuple(map(dist, points, islice(points, 1, None)))
+        return lengths
 
     def get_total_length(self) -> float:
         """
@@ -134,22 +244,7 @@ class Polyline(BaseSVGComponent):
         Returns:
             Total polyline length
         """
-        if len(self.config.points) < 2:
-            return 0.0
-
-        import math
-
-        total_length = 0.0
-
-        for i in range(len(self.config.points) - 1):
-            x1, y1 = self.config.points[i]
-            x2, y2 = self.config.points[i + 1]
-            dx = x2 - x1
-            dy = y2 - y1
-            segment_length = math.sqrt(dx**2 + dy**2)
-            total_length += segment_length
-
-        return total_length
+        return sum(self._segment_lengths(), 0.0)
 
     def get_segment_lengths(self) -> List[float]:
         """
@@ -158,22 +253,7 @@ class Polyline(BaseSVGComponent):
         Returns:
             List of segment lengths
         """
-        if len(self.config.points) < 2:
-            return []
-
-        import math
-
-        lengths = []
-
-        for i in range(len(self.config.points) - 1):
-            x1, y1 = self.config.points[i]
-            x2, y2 = self.config.points[i + 1]
-            dx = x2 - x1
-            dy = y2 - y1
-            segment_length = math.sqrt(dx**2 + dy**2)
-            lengths.append(segment_length)
-
-        return lengths
+        return list(self._segment_lengths())
 
     def add_point(self, x: float, y: float) -> "Polyline":
         """
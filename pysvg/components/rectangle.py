@@ -1,10 +1,17 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from operator import add
 from typing import Literal, Tuple
 from typing_extensions import override
 
 from pysvg.schema import AppearanceConfig, TransformConfig, BBox
 from pysvg.components.base import BaseSVGComponent, ComponentConfig
+from pysvg.components.batch import ColumnBatch
+from pysvg.utils import format_number
 from pydantic import Field
 
+_RECT_TEMPLATE = '<rect x="%s" y="%s" width="%s" height="%s"%s%s />'
+
 
 class RectangleConfig(ComponentConfig):
     """Geometry configuration for Rectangle components."""
@@ -19,8 +26,16 @@ class RectangleConfig(ComponentConfig):
     @override
     def to_svg_dict(self) -> dict[str, str]:
         """Convert config parameters to SVG attributes dictionary."""
-        attrs = self.model_dump(exclude_none=True)
-        attrs = {k: str(v) for k, v in attrs.items()}
+        attrs = {
+            "x": format_number(self.x),
+            "y": format_number(self.y),
+            "width": format_number(self.width),
+            "height": format_number(self.height),
+        }
+        if self.rx is not None:
+            attrs["rx"] = format_number(self.rx)
+        if self.ry is not None:
+            attrs["ry"] = format_number(self.ry)
         return attrs
 
 
@@ -41,6 +56,32 @@ class Rectangle(BaseSVGComponent):
             transform=transform or TransformConfig(),
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        x: Sequence[float],
+        y: Sequence[float],
+        width: Sequence[float],
+        height: Sequence[float],
+        appearance: AppearanceConfig | None = None,
+        transform: TransformConfig | None = None,
+    ) -> "RectangleBatch":
+        """
+        Create many rectangles sharing one appearance and transform at once.
+
+        Args:
+            x: Left x coordinates
+            y: Top y coordinates
+            width: Widths (must be positive)
+            height: Heights (must be positive)
+            appearance: Appearance shared by all rectangles
+            transform: Transform shared by all rectangles
+
+        Returns:
+            A RectangleBatch holding all rectangles
+        """
+        return RectangleBatch(x, y, width, height, appearance=appearance, transform=transform)
+
     @override
     @property
     def central_point_relative(self) -> Tuple[float, float]:
@@ -64,12 +105,8 @@ class Rectangle(BaseSVGComponent):
         current_width = self.config.width
         current_height = self.config.height
 
-        # Calculate scale factors for width and height
-        width_scale = width / current_width
-        height_scale = height / current_height
-
         # Use the smaller scale factor to ensure the rectangle fits within both limits
-        scale_factor = min(width_scale, height_scale)
+        scale_factor = self._compute_fit_scale(current_width, current_height, width, height)
 
         if mode == "fit" and scale_factor >= 1.0:
             return self
@@ -85,10 +122,75 @@ class Rectangle(BaseSVGComponent):
 
     @override
     def to_svg_element(self) -> str:
-        attrs = self.get_attr_dict()
-        attrs_ls = [f'{k}="{v}"' for k, v in attrs.items()]
-        return f"<rect {' '.join(attrs_ls)} />"
+        if (cached := self._load_svg_cache()) is not None:
+            return cached
+        config = self.config
+        corners = ""
+        if config.rx is not None:
+            corners += f' rx="{format_number(config.rx)}"'
+        if config.ry is not None:
+            corners += f' ry="{format_number(config.ry)}"'
+        svg = _RECT_TEMPLATE % (
+            format_number(config.x),
+            format_number(config.y),
+            format_number(config.width),
+            format_number(config.height),
+            corners,
+            self._tail_attr_str(),
+        )
+        return self._store_svg_cache(svg)
 
     def has_rounded_corners(self) -> bool:
         """Check if rectangle has rounded corners"""
         return self.config.rx is not None or self.config.ry is not None
+
+
+class RectangleBatch(ColumnBatch):
+    """
+    A batch of SVG rectangles sharing one appearance and transform.
+
+    Rectangles are stored in the `x`, `y`, `width` and `height` columns and render to one
+    `<rect>` element per rectangle.
+    """
+
+    _columns = ("x", "y", "width", "height")
+    # Batched rectangles have no rounded corners
+    _element_template = _RECT_TEMPLATE % ("%s", "%s", "%s", "%s", "", "%s")
+    _shape_name = "rectangle"
+
+    x: array
+    y: array
+    width: array
+    height: array
+
+    def __init__(
+        self,
+        x: Sequence[float],
+        y: Sequence[float],
+        width: Sequence[float],
+        height: Sequence[float],
+        appearance: AppearanceConfig | None = None,
+        transform: TransformConfig | None = None,
+    ):
+        super().__init__((x, y, width, height), appearance=appearance, transform=transform)
+        if min(self.width) <= 0 or min(self.height) <= 0:
+            raise ValueError("Rectangle width and height must be positive")
+
+    @override
+    def _get_edges(
+        self,
+    ) -> Tuple[Iterable[float], Iterable[float], Iterable[float], Iterable[float]]:
+        return (
+            self.x,
+            self.y,
+            map(add, self.x, self.width),
+            map(add, self.y, self.height),
+        )
+
+    @override
+    def _scale_columns(self, center_x: float, center_y: float, scale_factor: float) -> None:
+        # Scale corners relative to the center of the batch, and sizes in place
+        self.x = self._scale_about(self.x, center_x, scale_factor)
+        self.y = self._scale_about(self.y, center_y, scale_factor)
+        self.width = self._scale_in_place(self.width, scale_factor)
+        self.height = self._scale_in_place(self.height, scale_factor)
@@ -1,2 +1,5 @@
 SVG_NONE = "none"
 INDENT = "    "
+
+# Maximum number of decimal places of numbers written to SVG attributes
+NUMBER_PRECISION = 3
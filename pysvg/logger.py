@@ -1,10 +1,13 @@
 from loguru import logger
 from loguru._logger import Logger
 import sys
+from functools import cache
 from pathlib import Path
 
 from pysvg.globals import Globals
 
+_LOG_DIR = Path("logs")
+
 
 def get_logger() -> Logger:
     return logger
@@ -36,12 +39,8 @@ def configure_logging(
 
     # Add file handler if requested
     if use_file_handler:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / f"{Path().cwd().name}.log"
-
         logger.add(
-            log_file,
+            _get_log_file(),
             level=effective_file_level,
             rotation="10 MB",
             retention="7 days",
@@ -51,6 +50,13 @@ def configure_logging(
         )
 
 
+@cache
+def _get_log_file() -> Path:
+    """Get the log file path, creating the log directory on first use."""
+    _LOG_DIR.mkdir(exist_ok=True)
+    return _LOG_DIR / f"{Path.cwd().name}.log"
+
+
 def set_global_logging_level(level: int | str, use_file_handler: bool = False) -> None:
     """
     Updates the global logging level and reconfigures all active handlers.
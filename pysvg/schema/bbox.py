@@ -8,3 +8,7 @@ class BBox(BaseModel):
     y: float = Field(ge=0.0, description="Y coordinate of the top-left corner")
     width: float = Field(ge=0.0, description="Width of the bounding box")
     height: float = Field(ge=0.0, description="Height of the bounding box")
+
+    def as_tuple(self) -> tuple[float, float, float, float]:
+        """Get the bounding box as a plain (x, y, width, height) tuple."""
+        return (self.x, self.y, self.width, self.height)
@@ -15,7 +15,8 @@ from pysvg.constants import SVG_NONE
 class Color(BaseModel):
     """SVG color type that supports multiple color formats"""
 
-    model_config = ConfigDict(extra="forbid")
+    # Colors are immutable values, so they can be shared between configs
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     value: str = Field(description="Color value")
 
@@ -211,6 +212,14 @@ class Color(BaseModel):
             f"Invalid color format: '{v}'. Supported formats: color names, #hex, rgb(), rgba(), hsl(), hsla(), 'none', 'transparent'"
         )
 
+    def __copy__(self) -> "Color":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Color":
+        # Pydantic deep-copies field defaults for every new model instance;
+        # as an immutable value a color can be shared instead
+        return self
+
     def __str__(self) -> str:
         return self.value
 
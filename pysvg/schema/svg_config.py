@@ -1,4 +1,5 @@
-from typing import Any, List, Literal, Tuple, Union
+from itertools import count
+from typing import Any, Literal, Tuple, Union
 from abc import abstractmethod, ABC
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -6,6 +7,7 @@ from typing_extensions import override
 
 from .color import Color
 from pysvg.constants import SVG_NONE
+from pysvg.utils.misc import format_number
 
 # NOTE: DO NOT CHANGE THESE DEFAULT VALUES
 TRANSLATE_DEFAULT = (0, 0)
@@ -19,20 +21,83 @@ FILL_OPACITY_DEFAULT = 1
 STROKE_DEFAULT = Color(SVG_NONE)
 STROKE_WIDTH_DEFAULT = 1
 STROKE_OPACITY_DEFAULT = 1
-STROKE_DASHARRAY_DEFAULT = []
+STROKE_DASHARRAY_DEFAULT = ()
 STROKE_LINECAP_DEFAULT = "butt"
 
+# Process-wide source of config versions. Every new, copied or modified config draws a fresh
+# value, so a version can never repeat and render caches keyed on it can't match stale state
+next_svg_version = count(1).__next__
+
 
 class BaseSVGConfig(BaseModel, ABC):
     """Base configuration for SVG graphics"""
 
     model_config = ConfigDict(extra="forbid")
 
+    # NOTE: Render bookkeeping is kept in slots instead of pydantic private attributes:
+    #       private attributes add a noticeable cost to every model construction and
+    #       take part in `==`, which would make equal configs compare unequal
+    __slots__ = ("_svg_version", "_svg_attr_cache")
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._init_svg_state()
+
+    def _init_svg_state(self) -> None:
+        # Version of the config, replaced on every field assignment (used to invalidate render caches)
+        object.__setattr__(self, "_svg_version", next_svg_version())
+        # (version, attribute string) last rendered by to_svg_attr_str
+        object.__setattr__(self, "_svg_attr_cache", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        # Container fields are stored as tuples so they can only change through assignment (which
+        # bumps the version); assignment isn't validated, so plain lists are converted here as well
+        if type(value) is list:
+            value = tuple(value)
+        super().__setattr__(name, value)
+        self.mark_changed()
+
+    @property
+    def version(self) -> int:
+        """Version of the config, unique across all configs and replaced whenever it's modified."""
+        try:
+            return self._svg_version
+        except AttributeError:
+            # model_construct, copying and unpickling bypass model_post_init
+            self._init_svg_state()
+            return self._svg_version
+
+    def mark_changed(self) -> None:
+        """
+        Notify the config that it has been modified.
+
+        Field assignments call this automatically; container fields are stored as tuples, or as
+        containers that report their own version, so in-place modifications are tracked too.
+        """
+        object.__setattr__(self, "_svg_version", next_svg_version())
+
     @abstractmethod
     def to_svg_dict(self) -> dict[str, str]:
         """Convert config parameters to SVG attributes dictionary."""
         raise NotImplementedError("Not implemented")
 
+    def to_svg_attr_str(self) -> str:
+        """
+        Convert config parameters to an SVG attributes string, e.g. `fill="red" stroke="blue"`.
+
+        The result is memoized until the config is modified.
+        """
+        version = self.version
+        cache = self._svg_attr_cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        attr_str = " ".join([f'{k}="{v}"' for k, v in self.to_svg_dict().items()])
+        object.__setattr__(self, "_svg_attr_cache", (version, attr_str))
+        return attr_str
+
 
 class ComponentConfig(BaseSVGConfig):
     """Base configuration for all components"""
@@ -61,8 +126,9 @@ class AppearanceConfig(BaseSVGConfig):
     # Stroke opacity
     stroke_opacity: float = Field(default=STROKE_OPACITY_DEFAULT, ge=0.0, le=1.0)
 
-    # Stroke dash pattern, representing lengths of solid and blank segments
-    stroke_dasharray: List[float] = Field(default=STROKE_DASHARRAY_DEFAULT)
+    # Stroke dash pattern, representing lengths of solid and blank segments. Stored as a tuple so
+    # it can only be changed by reassignment, which keeps the memoized attribute string in sync
+    stroke_dasharray: Tuple[float, ...] = Field(default=STROKE_DASHARRAY_DEFAULT)
 
     # Stroke line cap style
     stroke_linecap: Literal["butt", "round", "square"] = Field(default=STROKE_LINECAP_DEFAULT)
@@ -78,31 +144,26 @@ class AppearanceConfig(BaseSVGConfig):
 
     @override
     def to_svg_dict(self) -> dict[str, str]:
-        """Convert to SVG attributes dictionary using Pydantic serialization"""
-        data = self.model_dump(exclude_none=True)
+        """Convert explicitly set fields to SVG attributes dictionary"""
+        # Read the fields directly instead of going through Pydantic serialization,
+        # colors already hold their SVG-ready value
+        fields_set = self.model_fields_set
         svg_attrs = {}
 
-        # Handle attribute name mapping and special conversions
-        attr_mapping = {
-            "fill_opacity": "fill-opacity",
-            "stroke_width": "stroke-width",
-            "stroke_opacity": "stroke-opacity",
-            "stroke_dasharray": "stroke-dasharray",
-            "stroke_linecap": "stroke-linecap",
-        }
-
-        for key, value in data.items():
-            if key not in self.model_fields_set:
-                continue
-
-            svg_key = attr_mapping.get(key, key)
-
-            # Special handling for different types of values
-            if key == "stroke_dasharray":
-                assert isinstance(value, list)
-                svg_attrs[svg_key] = ",".join(map(str, value))
-            else:
-                svg_attrs[svg_key] = str(value)
+        if "fill" in fields_set:
+            svg_attrs["fill"] = self.fill.value
+        if "fill_opacity" in fields_set:
+            svg_attrs["fill-opacity"] = format_number(self.fill_opacity)
+        if "stroke" in fields_set:
+            svg_attrs["stroke"] = self.stroke.value
+        if "stroke_width" in fields_set:
+            svg_attrs["stroke-width"] = format_number(self.stroke_width)
+        if "stroke_opacity" in fields_set:
+            svg_attrs["stroke-opacity"] = format_number(self.stroke_opacity)
+        if "stroke_dasharray" in fields_set:
+            svg_attrs["stroke-dasharray"] = ",".join(map(format_number, self.stroke_dasharray))
+        if "stroke_linecap" in fields_set:
+            svg_attrs["stroke-linecap"] = self.stroke_linecap
 
         return svg_attrs
 
@@ -133,20 +194,22 @@ class TransformConfig(BaseSVGConfig):
 
         if "translate" in self.model_fields_set and self.translate != TRANSLATE_DEFAULT:
             tx, ty = self.translate
-            transform_parts.append(f"translate({tx},{ty})")
+            transform_parts.append(f"translate({format_number(tx)},{format_number(ty)})")
 
         if "rotate" in self.model_fields_set and self.rotate != ROTATE_DEFAULT:
             if isinstance(self.rotate, (int, float)):
-                transform_parts.append(f"rotate({self.rotate})")
+                transform_parts.append(f"rotate({format_number(self.rotate)})")
             else:
                 angle, cx, cy = self.rotate
-                transform_parts.append(f"rotate({angle},{cx},{cy})")
+                transform_parts.append(
+                    f"rotate({format_number(angle)},{format_number(cx)},{format_number(cy)})"
+                )
 
         if "skew_x" in self.model_fields_set and self.skew_x != SKEW_X_DEFAULT:
-            transform_parts.append(f"skewX({self.skew_x})")
+            transform_parts.append(f"skewX({format_number(self.skew_x)})")
 
         if "skew_y" in self.model_fields_set and self.skew_y != SKEW_Y_DEFAULT:
-            transform_parts.append(f"skewY({self.skew_y})")
+            transform_parts.append(f"skewY({format_number(self.skew_y)})")
 
         if transform_parts:
             return {"transform": " ".join(transform_parts)}
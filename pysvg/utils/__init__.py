@@ -2,6 +2,7 @@ from .path import resolve_path, touch, mkdir, rmfile, rmdir
 from .list import change_list_type, get_list_elem
 from .iterator import MatrixIterator, MatrixBoardIterator
 from .matrix import add_matrix_border
+from .misc import format_number
 
 __all__ = [
     "resolve_path",
@@ -14,4 +15,5 @@ __all__ = [
     "MatrixIterator",
     "MatrixBoardIterator",
     "add_matrix_border",
+    "format_number",
 ]
@@ -0,0 +1,25 @@
+from pysvg.constants import NUMBER_PRECISION
+
+
+def format_number(value: float, precision: int = NUMBER_PRECISION) -> str:
+    """
+    Format a number as a compact SVG attribute value.
+
+    The value is rounded to `precision` decimal places, and integral values are written
+    without a fractional part, e.g. `50.0 -> "50"`, `0.30000000000000004 -> "0.3"`.
+
+    Args:
+        value: Number to format
+        precision: Maximum number of decimal places
+
+    Returns:
+        The formatted number
+    """
+    value = round(value, precision)
+    if isinstance(value, int):
+        return str(int(value))
+    # Convert other number types (e.g. numpy.float64, whose repr isn't a plain number) to float
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
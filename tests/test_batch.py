@@ -0,0 +1,84 @@
+import pytest
+from pysvg.components import Canvas, Circle, CircleBatch, Rectangle, RectangleBatch
+from pysvg.schema import AppearanceConfig, Color
+
+# Two shapes per batch type, with the expected union extent (x, y, width, height)
+BATCHES = [
+    pytest.param(CircleBatch, ([10, 30], [10, 20], [5, 10]), (5, 5, 35, 25), id="circle"),
+    pytest.param(
+        RectangleBatch, ([0, 20], [0, 10], [10, 5], [10, 20]), (0, 0, 25, 30), id="rectangle"
+    ),
+]
+
+
+class TestColumnBatch:
+    """Test cases for the behavior shared by all column batches"""
+
+    def test_from_arrays(self):
+        """Test that the shapes' from_arrays build a batch"""
+        circles = Circle.from_arrays([10, 30], [10, 20], [5, 10])
+        assert isinstance(circles, CircleBatch)
+        assert len(circles) == 2
+
+        rectangles = Rectangle.from_arrays([0, 20], [0, 10], [10, 5], [10, 20])
+        assert isinstance(rectangles, RectangleBatch)
+        assert len(rectangles) == 2
+
+    def test_invalid_input(self):
+        """Test that mismatched lengths, empty input and invalid sizes are rejected"""
+        with pytest.raises(ValueError, match="cx, cy and r must have the same length"):
+            CircleBatch([0, 1], [0], [1, 1])
+        with pytest.raises(ValueError, match="x, y, width and height must have the same length"):
+            RectangleBatch([0, 1], [0], [1, 1], [1, 1])
+        with pytest.raises(ValueError, match="at least one circle"):
+            CircleBatch([], [], [])
+        with pytest.raises(ValueError, match="at least one rectangle"):
+            RectangleBatch([], [], [], [])
+        with pytest.raises(ValueError, match="non-negative"):
+            CircleBatch([0], [0], [-1])
+        with pytest.raises(ValueError, match="positive"):
+            RectangleBatch([0], [0], [0], [1])
+
+    @pytest.mark.parametrize("batch_cls, columns, extent", BATCHES)
+    def test_bounding_box(self, batch_cls, columns, extent):
+        """Test the bounding box covers all shapes"""
+        batch = batch_cls(*columns)
+        assert batch.get_bounding_box().as_tuple() == extent
+        x, y, width, height = extent
+        assert batch.central_point_relative == (x + width / 2, y + height / 2)
+
+    @pytest.mark.parametrize("batch_cls, columns, extent", BATCHES)
+    def test_restrict_size(self, batch_cls, columns, extent):
+        """Test that restrict_size keeps the center and scales the batch"""
+        batch = batch_cls(*columns)
+        center = batch.central_point_relative
+        batch.restrict_size(extent[2] / 2, 100)
+        bbox = batch.get_bounding_box()
+        assert bbox.width == pytest.approx(extent[2] / 2)
+        assert bbox.height == pytest.approx(extent[3] / 2)
+        assert batch.central_point_relative == pytest.approx(center)
+
+    def test_zero_size_restrict_size(self):
+        """Test that scaling a batch without extent leaves it unchanged"""
+        batch = Circle.from_arrays([5], [5], [0])
+        batch.restrict_size(10, 10, mode="force")
+        batch.scale(2)
+        assert batch.to_svg_element() == '<circle cx="5" cy="5" r="0" />'
+
+    def test_to_svg_element(self):
+        """Test that every shape is rendered with the shared appearance"""
+        appearance = AppearanceConfig(fill=Color("red"))
+        circles = CircleBatch([10, 30], [10, 20], [5, 10], appearance=appearance)
+        assert circles.to_svg_element() == (
+            '<circle cx="10" cy="10" r="5" fill="red" />\n'
+            '<circle cx="30" cy="20" r="10" fill="red" />'
+        )
+        rectangles = RectangleBatch([0, 20], [0, 10], [10, 5], [10, 20], appearance=appearance)
+        assert rectangles.to_svg_element() == (
+            '<rect x="0" y="0" width="10" height="10" fill="red" />\n'
+            '<rect x="20" y="10" width="5" height="20" fill="red" />'
+        )
+
+        svg = Canvas(100, 100).add(circles).add(rectangles).to_svg_element()
+        assert svg.count("<circle") == 2
+        assert svg.count("<rect") == 2
@@ -0,0 +1,26 @@
+from pysvg.components import Canvas, Circle, CircleConfig, Rectangle, RectangleConfig, TextContent
+
+
+class TestCanvas:
+    """Test cases for Canvas"""
+
+    def test_components_bounding_box(self):
+        """Test the union bounding box of the canvas components"""
+        canvas = Canvas(width=100, height=100)
+        canvas.add(Circle(config=CircleConfig(cx=10, cy=10, r=5)))
+        canvas.add(Rectangle(config=RectangleConfig(x=20, y=30, width=10, height=5)))
+        # Text has no bounding box and is skipped
+        canvas.add(TextContent("text"))
+
+        bbox = canvas.get_components_bounding_box()
+        assert bbox.as_tuple() == (5, 5, 25, 30)
+
+    def test_components_bounding_box_empty(self):
+        """Test that an empty canvas has no components bounding box"""
+        assert Canvas(width=100, height=100).get_components_bounding_box() is None
+
+    def test_zero_size_restrict_size(self):
+        """Test that forcing the size of a zero-sized canvas leaves it unchanged"""
+        canvas = Canvas(width=0, height=0)
+        canvas.restrict_size(100, 100, mode="force")
+        assert (canvas.config.width, canvas.config.height) == (0, 0)
@@ -0,0 +1,40 @@
+import pytest
+from pysvg.utils import format_number
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (50, "50"),
+        (50.0, "50"),
+        (-0.0, "0"),
+        (0.30000000000000004, "0.3"),
+        (12.3456, "12.346"),
+        (-1.5, "-1.5"),
+        (1e-5, "0"),
+    ],
+)
+def test_format_number(value, expected):
+    """Test that numbers are rounded and written without a trailing `.0`"""
+    assert format_number(value) == expected
+
+
+def test_format_number_precision():
+    """Test formatting with a custom precision"""
+    assert format_number(3.14159, precision=1) == "3.1"
+
+
+class _TaggedFloat(float):
+    """Float subclass with a non-numeric repr that survives rounding, like numpy.float64."""
+
+    def __repr__(self):
+        return f"_TaggedFloat({float(self)!r})"
+
+    def __round__(self, ndigits=None):
+        return _TaggedFloat(float.__round__(self, ndigits))
+
+
+def test_format_number_float_subclass():
+    """Test that float subclasses are written as plain numbers"""
+    assert format_number(_TaggedFloat(2.5)) == "2.5"
+    assert format_number(_TaggedFloat(2.0)) == "2"
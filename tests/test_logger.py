@@ -0,0 +1,37 @@
+from loguru import logger
+
+from pysvg.logger import set_global_logging_level
+
+
+class TestLogger:
+    """Test cases for the logging configuration"""
+
+    def test_reconfigure_after_external_removal(self, capsys):
+        """Test that console logging works again after handlers were removed directly"""
+        set_global_logging_level("INFO")
+        logger.remove()
+        set_global_logging_level("INFO")
+
+        logger.info("console message")
+        assert "console message" in capsys.readouterr().err
+
+    def test_reconfigure_removes_other_handlers(self):
+        """Test that reconfiguring removes handlers added elsewhere"""
+        messages = []
+        set_global_logging_level("INFO")
+        logger.add(messages.append)
+        set_global_logging_level("INFO")
+
+        logger.info("dropped message")
+        assert messages == []
+
+    def test_level_change(self, capsys):
+        """Test that changing the level takes effect on the console handler"""
+        set_global_logging_level("WARNING")
+        logger.info("hidden message")
+        set_global_logging_level("DEBUG")
+        logger.debug("shown message")
+
+        err = capsys.readouterr().err
+        assert "hidden message" not in err
+        assert "shown message" in err
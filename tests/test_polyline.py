@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from pysvg.components import Polyline, PolylineConfig
+
+
+class TestPolyline:
+    """Test cases for Polyline geometry"""
+
+    def test_segment_lengths_follow_point_changes(self):
+        """Test that the memoized segment lengths are recomputed after the points change"""
+        polyline = Polyline(config=PolylineConfig(points=[(0, 0), (3, 4)]))
+        assert polyline.get_total_length() == 5.0
+        assert polyline.get_segment_lengths() == [5.0]
+
+        polyline.add_point(3, 10)
+        assert polyline.get_segment_lengths() == [5.0, 6.0]
+        assert polyline.get_total_length() == 11.0
+
+        polyline.config = PolylineConfig(points=[(0, 0), (0, 2)])
+        assert polyline.get_total_length() == 2.0
+
+        polyline.clear_points()
+        assert polyline.get_total_length() == 0.0
+        assert polyline.get_segment_lengths() == []
+
+    def test_points_are_validated(self):
+        """Test that malformed points are rejected when building a polyline config"""
+        with pytest.raises(ValidationError):
+            PolylineConfig(points=[])
+        with pytest.raises(ValidationError):
+            PolylineConfig(points=[(1, 2, 3)])
+        with pytest.raises(ValidationError):
+            PolylineConfig(points=[("a", 2)])
+
+    def test_center_follows_point_changes(self):
+        """Test that the memoized polyline center is recomputed after the points change"""
+        polyline = Polyline(config=PolylineConfig(points=[(0, 0), (4, 0)]))
+        assert polyline.central_point_relative == (2, 0)
+
+        polyline.add_points([(4, 6), (0, 6)])
+        assert polyline.central_point_relative == (2, 3)
+
+        polyline.config.points = [(10, 10)]
+        assert polyline.central_point_relative == (10, 10)
+
+    def test_restrict_size_uses_current_extents(self):
+        """Test that restrict_size sees point changes made after an earlier bounding box query"""
+        polyline = Polyline(config=PolylineConfig(points=[(0, 0), (10, 10)]))
+        assert polyline.get_bounding_box().width == 10
+
+        polyline.restrict_size(20, 20)
+        assert polyline.config.points == [(0, 0), (10, 10)]
+
+        polyline.add_point(40, 10)
+        polyline.restrict_size(20, 20)
+        assert polyline.get_bounding_box().width == 20
+        assert polyline.get_bounding_box().height == 5
+
+    def test_single_point(self):
+        """Test that a single-point polyline has its point as center and ignores resizing"""
+        polyline = Polyline(config=PolylineConfig(points=[(3.5, 4.5)]))
+        assert polyline.central_point_relative == (3.5, 4.5)
+
+        polyline.restrict_size(1, 1, mode="force")
+        assert polyline.config.points == [(3.5, 4.5)]
+
+    def test_coincident_points(self):
+        """Test that forcing the size of a polyline whose points coincide leaves it unchanged"""
+        polyline = Polyline(config=PolylineConfig(points=[(1, 1), (1, 1)]))
+        polyline.restrict_size(10, 10, mode="force")
+        assert polyline.config.points == [(1, 1), (1, 1)]
+        assert 'points="1,1 1,1"' in polyline.to_svg_element()
+
+    def test_add_point_is_amortized_constant_time(self):
+        """Test that appending points one by one doesn't copy the whole point list each time"""
+        polyline = Polyline(config=PolylineConfig(points=[(0, 0)]))
+        start = time.perf_counter()
+        for i in range(50_000):
+            polyline.add_point(i, i)
+        # Copying the points on every call takes tens of seconds for this many points
+        assert time.perf_counter() - start < 2
+        assert polyline.get_point_count() == 50_001
@@ -0,0 +1,134 @@
+import copy
+import pickle
+
+from pysvg.components import (
+    Circle,
+    CircleConfig,
+    Polyline,
+    PolylineConfig,
+    Rectangle,
+    RectangleConfig,
+    TextContent,
+    TextConfig,
+)
+from pysvg.schema import AppearanceConfig, Color
+
+
+class TestSVGElementCache:
+    """Test cases for the cached output of to_svg_element"""
+
+    def test_repeated_calls_reuse_cache(self):
+        """Test that an unchanged component returns the cached string"""
+        circle = Circle(config=CircleConfig(r=10))
+        first = circle.to_svg_element()
+        assert circle.to_svg_element() is first
+
+    def test_config_assignment_invalidates_cache(self):
+        """Test that assigning a config field re-renders the element"""
+        circle = Circle(config=CircleConfig(r=10))
+        circle.to_svg_element()
+
+        circle.config.r = 20
+        assert 'r="20"' in circle.to_svg_element()
+
+        circle.appearance.fill = Color("red")
+        assert 'fill="red"' in circle.to_svg_element()
+
+    def test_transform_methods_invalidate_cache(self):
+        """Test that move/rotate re-render the element"""
+        circle = Circle(config=CircleConfig(cx=0, cy=0, r=10))
+        circle.to_svg_element()
+
+        circle.move(100, 50)
+        assert "translate(100" in circle.to_svg_element()
+
+        circle.rotate(45)
+        assert "rotate(45" in circle.to_svg_element()
+
+    def test_scale_invalidates_cache(self):
+        """Test that scaling re-renders the element"""
+        circle = Circle(config=CircleConfig(r=10))
+        before = circle.to_svg_element()
+        circle.scale(2)
+        assert circle.to_svg_element() != before
+
+    def test_attribute_replacement_invalidates_cache(self):
+        """Test that replacing a config object or a component attribute re-renders the element"""
+        circle = Circle(config=CircleConfig(r=10))
+        circle.to_svg_element()
+        circle.appearance = AppearanceConfig(stroke=Color("blue"))
+        assert 'stroke="blue"' in circle.to_svg_element()
+
+        text = TextContent("hello", config=TextConfig())
+        assert ">hello</text>" in text.to_svg_element()
+        text.text = "world"
+        assert ">world</text>" in text.to_svg_element()
+
+    def test_dasharray_cannot_be_mutated_in_place(self):
+        """Test that the dash pattern is stored immutably and reassignment re-renders the element"""
+        circle = Circle(appearance=AppearanceConfig(stroke_dasharray=[1, 2]))
+        assert 'stroke-dasharray="1,2"' in circle.to_svg_element()
+        assert isinstance(circle.appearance.stroke_dasharray, tuple)
+
+        circle.appearance.stroke_dasharray = [1, 2, 3]
+        assert isinstance(circle.appearance.stroke_dasharray, tuple)
+        assert 'stroke-dasharray="1,2,3"' in circle.to_svg_element()
+
+    def test_config_equality_ignores_render_state(self):
+        """Test that configs with equal fields stay equal regardless of their modification history"""
+        first = CircleConfig(r=10)
+        second = CircleConfig(r=5)
+        second.r = 10
+        assert first.version != second.version
+        assert first == second
+
+    def test_in_place_point_changes_invalidate_cache(self):
+        """Test that adding or clearing polyline points re-renders the element"""
+        polyline = Polyline(config=PolylineConfig(points=[(0.5, 1.5), (10.5, 10.5)]))
+        assert 'points="0.5,1.5 10.5,10.5"' in polyline.to_svg_element()
+
+        polyline.add_point(20.5, 0.5)
+        assert 'points="0.5,1.5 10.5,10.5 20.5,0.5"' in polyline.to_svg_element()
+
+        # Modifying the point list directly is tracked as well
+        polyline.config.points.append((30.5, 1.5))
+        assert 'points="0.5,1.5 10.5,10.5 20.5,0.5 30.5,1.5"' in polyline.to_svg_element()
+        assert polyline.get_bounding_box().width == 30
+        polyline.config.points[0] = (5.5, 1.5)
+        assert 'points="5.5,1.5 10.5,10.5' in polyline.to_svg_element()
+
+        polyline.clear_points()
+        assert "points" not in polyline.to_svg_element()
+
+    def test_rectangle_cache_follows_restrict_size(self):
+        """Test that resizing a rectangle re-renders the element"""
+        rect = Rectangle(config=RectangleConfig(width=200, height=100, rx=10))
+        first = rect.to_svg_element()
+        assert rect.to_svg_element() is first
+
+        rect.restrict_size(100, 100)
+        assert 'width="100" height="50" rx="5"' in rect.to_svg_element()
+
+    def test_copied_components_do_not_reuse_stale_cache(self):
+        """Test that deep-copied and unpickled components re-render after the copy is modified"""
+        circle = Circle(config=CircleConfig(r=1))
+        circle.config.r = 2
+        circle.config.r = 3
+        circle.to_svg_element()
+
+        for clone in (copy.deepcopy(circle), pickle.loads(pickle.dumps(circle))):
+            clone.config.r = 4
+            clone.config.r = 5
+            assert 'r="5"' in clone.to_svg_element()
+        assert 'r="3"' in circle.to_svg_element()
+
+        polyline = Polyline(config=PolylineConfig(points=[(0, 0), (3, 4)]))
+        polyline.add_point(3, 10)
+        assert polyline.get_total_length() == 11.0
+
+        for clone in (copy.deepcopy(polyline), pickle.loads(pickle.dumps(polyline))):
+            clone.add_point(3, 20)
+            clone.add_point(3, 30)
+            assert clone.get_total_length() == 31.0
+            assert clone.get_bounding_box().height == 30
+        assert polyline.get_total_length() == 11.0